@@ -2,6 +2,29 @@ import sqlite3
 import os
 import argparse
 
+# Path to the schema file
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config", "schema_offline.sql")
+
+def apply_schema(db):
+    """
+    Apply the offline schema to `db`, either a path to the SQLite database file
+    or an already-open sqlite3.Connection (which is left open for the caller).
+    """
+    if isinstance(db, sqlite3.Connection):
+        conn = db
+    else:
+        # Ensure the DB file exists (or create it)
+        conn = sqlite3.connect(db)
+
+    try:
+        # Read and execute all SQL from the schema file
+        with open(SCHEMA_PATH, "r", encoding="utf-8") as f:
+            conn.executescript(f.read())
+        conn.commit()
+    finally:
+        if conn is not db:
+            conn.close()
+
 def main():
     parser = argparse.ArgumentParser(description="Apply SQLite schema to database")
     parser.add_argument("--db", "-d", required=True, help="Path to the SQLite database file")
@@ -9,20 +32,7 @@ def main():
     
     # Path to your target DB (from command line argument)
     db_path = args.db
-    # Path to the schema file
-    schema_path = os.path.join(os.path.dirname(__file__), "config", "schema_offline.sql")
-
-    # Ensure the DB file exists (or create it)
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    # Read and execute all SQL from the schema file
-    with open(schema_path, "r", encoding="utf-8") as f:
-        schema_sql = f.read()
-        cursor.executescript(schema_sql)
-
-    conn.commit()
-    conn.close()
+    apply_schema(db_path)
     print(f"Schema applied to {db_path}")
 
 if __name__ == "__main__":
@@ -7,6 +7,8 @@ import os
 import json
 from datetime import datetime
 
+from apply_schema import apply_schema
+
 def create_test_database(db_path="test_reports.db"):
     """Create a test database with sample data"""
     
@@ -14,15 +16,19 @@ def create_test_database(db_path="test_reports.db"):
     if os.path.exists(db_path):
         os.remove(db_path)
     
-    # Apply schema first
-    print("Applying schema...")
-    os.system(f'python apply_schema.py --db "{db_path}"')
-    
     # Connect to database
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
-    # Sample data with MGRS coordinates
+    # Throwaway seed data: skip the rollback journal while loading
+    cursor.execute("PRAGMA journal_mode=OFF")
+    
+    # Apply schema first, on the same connection used for seeding
+    print("Applying schema...")
+    apply_schema(conn)
+    
+    # Sample data with MGRS coordinates, all stamped with the same processing time
+    now_iso = datetime.now().isoformat()
     sample_reports = [
         {
             "id": "report_001",
@@ -38,7 +44,7 @@ def create_test_database(db_path="test_reports.db"):
             "MGRS": "38SMB4484536781",  # Baghdad area
             "images": None,
             "full_text": "This report covers the infrastructure assessment of key transportation routes in Baghdad, focusing on bridge conditions and security checkpoints.",
-            "processed_time": datetime.now().isoformat()
+            "processed_time": now_iso
         },
         {
             "id": "report_002", 
@@ -54,7 +60,7 @@ def create_test_database(db_path="test_reports.db"):
             "MGRS": "42SXD8914734521",  # Kabul area
             "images": None,
             "full_text": "Economic analysis of local markets in Kabul, including vendor interviews and trade pattern observations.",
-            "processed_time": datetime.now().isoformat()
+            "processed_time": now_iso
         },
         {
             "id": "report_003",
@@ -70,28 +76,35 @@ def create_test_database(db_path="test_reports.db"):
             "MGRS": "37SCT7654321098",  # Damascus area
             "images": None,
             "full_text": "Survey of urban development projects in Damascus, documenting new construction and infrastructure improvements.",
-            "processed_time": datetime.now().isoformat()
+            "processed_time": now_iso
         }
     ]
     
-    # Insert sample data
+    # Insert sample data in a single transaction, reusing one prepared statement
     print("Inserting sample data...")
-    for report in sample_reports:
-        cursor.execute("""
-            INSERT INTO reports (
-                id, file_hash, highest_classification, caveats, file_path,
-                locations, timeframes, subjects, topics, keywords, MGRS,
-                images, full_text, processed_time
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    rows = [
+        (
             report["id"], report["file_hash"], report["highest_classification"],
             report["caveats"], report["file_path"], report["locations"],
             report["timeframes"], report["subjects"], report["topics"],
             report["keywords"], report["MGRS"], report["images"],
             report["full_text"], report["processed_time"]
-        ))
+        )
+        for report in sample_reports
+    ]
+    cursor.execute("BEGIN")
+    cursor.executemany("""
+        INSERT INTO reports (
+            id, file_hash, highest_classification, caveats, file_path,
+            locations, timeframes, subjects, topics, keywords, MGRS,
+            images, full_text, processed_time
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
     
     conn.commit()
+    
+    # Restore SQLite's default rollback journal for normal use of the database
+    cursor.execute("PRAGMA journal_mode=DELETE")
     conn.close()
     
     print(f"[SUCCESS] Test database created: {db_path}")
@@ -4,6 +4,9 @@ import mgrs
 from simplekml import Kml
 from typing import List, Dict, Any
 
+# Shared converter, built once on import rather than per export
+_CONVERTER = mgrs.MGRS()
+
 def generate_kmz_from_mgrs(
     rows: List[Dict[str, Any]],
     mgrs_col: str = "MGRS"
@@ -11,7 +14,6 @@ def generate_kmz_from_mgrs(
     """
     Build a KMZ (zip of doc.kml) from rows that contain an MGRS string.
     """
-    converter = mgrs.MGRS()
     kml = Kml()
 
     for row in rows:
@@ -19,7 +21,7 @@ def generate_kmz_from_mgrs(
         if not m:
             continue
         try:
-            lat, lon = converter.toLatLon(m)
+            lat, lon = _CONVERTER.toLatLon(m)
         except Exception:
             continue
         # Use an ID or the MGRS string itself for the placemark name
@@ -4,10 +4,25 @@ import os
 import re
 import hashlib
 import mimetypes
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from itertools import repeat
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
+# Shared MGRS converter, created on first use since mgrs is optional for file processing
+_mgrs_converter = None
+
+def _get_mgrs_converter():
+    """Return the process-wide MGRS converter (raises ImportError if mgrs is missing)"""
+    global _mgrs_converter
+    if _mgrs_converter is None:
+        import mgrs
+        _mgrs_converter = mgrs.MGRS()
+    return _mgrs_converter
+
 class FileProcessor:
     """Process various file types and extract metadata and content"""
     
@@ -21,6 +36,21 @@ class FileProcessor:
         'other': ['.xml', '.json', '.html', '.htm']
     }
     
+    # Extension -> category lookup, precomputed from SUPPORTED_EXTENSIONS
+    EXTENSION_CATEGORIES = {ext: category for category, exts in SUPPORTED_EXTENSIONS.items() for ext in exts}
+    
+    # Extension -> processing method; anything not listed gets generic processing
+    FILE_HANDLERS = {
+        **{ext: 'process_text_file' for ext in SUPPORTED_EXTENSIONS['text']},
+        **{ext: 'process_kml_file' for ext in SUPPORTED_EXTENSIONS['kml']},
+        **{ext: 'process_pdf_file' for ext in SUPPORTED_EXTENSIONS['pdf']},
+        '.docx': 'process_word_file',
+        '.doc': 'process_legacy_word_file'
+    }
+    
+    # Below this much input, spawning worker processes costs more than it saves
+    PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+    
     # MGRS coordinate patterns
     MGRS_PATTERNS = [
         r'\b\d{1,2}[A-Z]{3}\d{4,10}\b',  # Standard MGRS
@@ -34,6 +64,27 @@ class FileProcessor:
         r'\d{1,3}[°]\s*\d{1,2}[\']\s*\d{1,2}[\"]\s*[NS]\s*,?\s*\d{1,3}[°]\s*\d{1,2}[\']\s*\d{1,2}[\"]\s*[EW]'  # DMS
     ]
     
+    # An alternation never returns overlapping matches, so patterns are only joined where their hits
+    # cannot overlap. The MGRS forms differ in where whitespace sits after the leading digits and each
+    # starts at a word boundary, so they are joined into one scan. Decimal and DMS GPS matches can share
+    # characters (e.g. '1.5 2.33°18\'45"N ...'), and MGRS can overlap GPS, so those stay separate scans.
+    MGRS_REGEX = re.compile('|'.join(f'(?:{p})' for p in MGRS_PATTERNS), re.IGNORECASE)
+    GPS_REGEXES = [re.compile(p, re.IGNORECASE) for p in GPS_PATTERNS]
+    
+    # Candidate keyword tokens
+    WORD_PATTERN = re.compile(r'\b[A-Za-z]{3,}\b')
+    
+    # Common words excluded from keyword extraction
+    COMMON_WORDS = frozenset({
+        'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 'was', 'one',
+        'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'its', 'may', 'new', 'now', 'old',
+        'see', 'two', 'who', 'boy', 'did', 'she', 'use', 'way', 'many', 'then', 'them', 'well',
+        'were', 'been', 'good', 'much', 'some', 'time', 'very', 'when', 'come', 'here', 'just',
+        'like', 'long', 'make', 'over', 'such', 'take', 'than', 'only', 'little', 'state', 'years',
+        'people', 'after', 'first', 'never', 'these', 'think', 'where', 'being', 'every', 'great',
+        'might', 'shall', 'still', 'those', 'under', 'while', 'could', 'other'
+    })
+    
     def __init__(self):
         self.stats = {
             'files_processed': 0,
@@ -56,41 +107,31 @@ class FileProcessor:
         if allowed_types:
             return ext.lstrip('.') in allowed_types
         
-        for category in self.SUPPORTED_EXTENSIONS.values():
-            if ext in category:
-                return True
-        return False
+        return ext in self.EXTENSION_CATEGORIES
     
     def extract_coordinates(self, text: str) -> Tuple[List[str], List[str]]:
         """Extract MGRS and GPS coordinates from text"""
-        mgrs_coords = []
-        gps_coords = []
-        
         # Extract MGRS coordinates
-        for pattern in self.MGRS_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            mgrs_coords.extend(matches)
+        mgrs_coords = self.MGRS_REGEX.findall(text)
         
         # Extract GPS coordinates
-        for pattern in self.GPS_PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            gps_coords.extend(matches)
-        
-        # Remove duplicates and clean up
-        mgrs_coords = list(set([coord.strip().upper() for coord in mgrs_coords]))
-        gps_coords = list(set([coord.strip() for coord in gps_coords]))
+        gps_coords = []
+        for pattern in self.GPS_REGEXES:
+            gps_coords.extend(pattern.findall(text))
         
-        return mgrs_coords, gps_coords
+        # Clean up and remove duplicates, keeping first-seen order (dict.fromkeys dedupes in C)
+        return (
+            list(dict.fromkeys(coord.strip().upper() for coord in mgrs_coords)),
+            list(dict.fromkeys(coord.strip() for coord in gps_coords))
+        )
     
     def extract_keywords(self, text: str) -> List[str]:
         """Extract potential keywords from text"""
         # Simple keyword extraction - can be enhanced
-        words = re.findall(r'\b[A-Za-z]{3,}\b', text)
+        words = self.WORD_PATTERN.findall(text)
         
-        # Filter out common words and get unique terms
-        common_words = {'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'its', 'may', 'new', 'now', 'old', 'see', 'two', 'who', 'boy', 'did', 'she', 'use', 'her', 'way', 'many', 'then', 'them', 'well', 'were', 'been', 'good', 'much', 'some', 'time', 'very', 'when', 'come', 'here', 'just', 'like', 'long', 'make', 'over', 'such', 'take', 'than', 'only', 'little', 'state', 'years', 'people', 'after', 'first', 'never', 'these', 'think', 'where', 'being', 'every', 'great', 'might', 'shall', 'still', 'those', 'under', 'while', 'could', 'other', 'after', 'first', 'never', 'these', 'think', 'where', 'being', 'every', 'great', 'might', 'shall', 'still', 'those', 'under', 'while'}
-        
-        keywords = [word.lower() for word in words if len(word) > 3 and word.lower() not in common_words]
+        # Filter out common words and get unique terms, lowercasing each word only once
+        keywords = [word for word in (w.lower() for w in words) if len(word) > 3 and word not in self.COMMON_WORDS]
         
         # Return most frequent keywords (up to 20)
         from collections import Counter
@@ -166,8 +207,7 @@ class FileProcessor:
             # Convert coordinates to MGRS if possible
             mgrs_coords = []
             try:
-                import mgrs
-                converter = mgrs.MGRS()
+                converter = _get_mgrs_converter()
                 
                 for coord_str in coordinates:
                     try:
@@ -223,16 +263,9 @@ class FileProcessor:
             # Process based on file type
             ext = file_path.suffix.lower()
             
-            if ext in self.SUPPORTED_EXTENSIONS['text']:
-                data = self.process_text_file(str(file_path))
-            elif ext in self.SUPPORTED_EXTENSIONS['kml']:
-                data = self.process_kml_file(str(file_path))
-            elif ext in self.SUPPORTED_EXTENSIONS['pdf']:
-                data = self.process_pdf_file(str(file_path))
-            elif ext == '.docx':
-                data = self.process_word_file(str(file_path))
-            elif ext == '.doc':
-                data = self.process_legacy_word_file(str(file_path))
+            handler = self.FILE_HANDLERS.get(ext)
+            if handler:
+                data = getattr(self, handler)(str(file_path))
             else:
                 # Generic processing
                 data = {'full_text': f"File: {file_path.name}", 'keywords': file_path.stem}
@@ -258,16 +291,65 @@ class FileProcessor:
         
         return result
     
+    def process_files(self, file_paths: List[str], options: Dict[str, Any] = None,
+                      workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Process many files, using worker processes only for batches large enough to repay their startup"""
+        # Never start more worker processes than there are files
+        workers = min(workers or os.cpu_count() or 1, len(file_paths))
+        if workers <= 1 or self._total_size(file_paths) < self.PARALLEL_MIN_BYTES:
+            return self._process_sequentially(file_paths, options)
+        
+        # Hand each worker a few batches so IPC is amortized without leaving cores idle
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        results = []
+        done = 0
+        try:
+            # Spawn rather than fork: this is called from server worker threads, and forking a threaded process can deadlock
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=_init_worker) as executor:
+                for result, stats in executor.map(_process_in_worker, file_paths, repeat(options), chunksize=chunksize):
+                    done += 1
+                    # Fold each worker's counters back into this processor's stats
+                    for key, value in stats.items():
+                        self.stats[key] += value
+                    if result is not None:
+                        results.append(result)
+        except BrokenProcessPool as e:
+            # Results arrive in order, so everything from `done` on still needs processing
+            print(f"Worker pool failed ({str(e)}), processing remaining {len(file_paths) - done} files sequentially")
+            results.extend(self._process_sequentially(file_paths[done:], options))
+        return results
+    
+    def _process_sequentially(self, file_paths: List[str], options: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Process files one by one in this process, skipping files that fail outright"""
+        results = [_process_safely(self, file_path, options) for file_path in file_paths]
+        return [result for result in results if result is not None]
+    
+    @staticmethod
+    def _total_size(file_paths: List[str]) -> int:
+        """Total size in bytes of the given files, ignoring any that can't be stat'ed"""
+        total = 0
+        for file_path in file_paths:
+            try:
+                total += os.path.getsize(file_path)
+            except OSError:
+                continue
+        return total
+    
     def process_pdf_file(self, file_path: str) -> Dict[str, Any]:
         """Process PDF files"""
         try:
             import PyPDF2
-            text_content = ""
+            # Collect page text and join once instead of re-copying the document per page
+            text_parts = []
             
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 for page in pdf_reader.pages:
-                    text_content += page.extract_text() + "\n"
+                    text_parts.append(page.extract_text())
+                    text_parts.append("\n")
+            
+            text_content = "".join(text_parts)
             
             mgrs_coords, gps_coords = self.extract_coordinates(text_content)
             keywords = self.extract_keywords(text_content)
@@ -298,18 +380,23 @@ class FileProcessor:
             from docx import Document
             
             doc = Document(file_path)
-            text_content = ""
+            # Collect text fragments and join once instead of re-copying the document per fragment
+            text_parts = []
             
             # Extract text from paragraphs
             for paragraph in doc.paragraphs:
-                text_content += paragraph.text + "\n"
+                text_parts.append(paragraph.text)
+                text_parts.append("\n")
             
             # Extract text from tables
             for table in doc.tables:
                 for row in table.rows:
                     for cell in row.cells:
-                        text_content += cell.text + " "
-                    text_content += "\n"
+                        text_parts.append(cell.text)
+                        text_parts.append(" ")
+                    text_parts.append("\n")
+            
+            text_content = "".join(text_parts)
             
             mgrs_coords, gps_coords = self.extract_coordinates(text_content)
             keywords = self.extract_keywords(text_content)
@@ -393,3 +480,26 @@ class FileProcessor:
                 files.append(str(file_path))
         
         return sorted(files)
+
+
+# Per-process FileProcessor used by process_files workers
+_worker_processor = None
+
+def _init_worker() -> None:
+    global _worker_processor
+    _worker_processor = FileProcessor()
+
+def _process_safely(processor: FileProcessor, file_path: str, options: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+    """Process a file, reporting and swallowing errors that process_file doesn't handle itself"""
+    try:
+        return processor.process_file(file_path, options)
+    except Exception as e:
+        print(f"Error processing {file_path}: {str(e)}")
+        return None
+
+def _process_in_worker(file_path: str, options: Dict[str, Any] = None) -> Tuple[Optional[Dict[str, Any]], Dict[str, int]]:
+    """Process one file in a pool worker, returning the result and the stats it contributed"""
+    processor = _worker_processor
+    processor.stats = dict.fromkeys(processor.stats, 0)
+    result = _process_safely(processor, file_path, options)
+    return result, processor.stats
@@ -11,6 +11,16 @@ from database_operations.file_processor import FileProcessor
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from database_operations.sqlite_operations import SQLiteDatabase
+from apply_schema import apply_schema
+
+# File extension -> file type category reported by /files
+FILE_TYPES = {
+    '.pdf': 'pdf',
+    '.doc': 'document', '.docx': 'document',
+    '.txt': 'text', '.md': 'text', '.log': 'text',
+    '.kml': 'geographic', '.kmz': 'geographic',
+    '.jpg': 'image', '.jpeg': 'image', '.png': 'image', '.gif': 'image'
+}
 
 def main():
     parser = argparse.ArgumentParser(description="CORE-Scout (Lite): SQLite Explorer")
@@ -125,17 +135,7 @@ def main():
                 file_ext = os.path.splitext(file_name)[1].lower() if file_name else ''
                 
                 # Determine file type category
-                file_type = 'unknown'
-                if file_ext in ['.pdf']:
-                    file_type = 'pdf'
-                elif file_ext in ['.doc', '.docx']:
-                    file_type = 'document'
-                elif file_ext in ['.txt', '.md', '.log']:
-                    file_type = 'text'
-                elif file_ext in ['.kml', '.kmz']:
-                    file_type = 'geographic'
-                elif file_ext in ['.jpg', '.jpeg', '.png', '.gif']:
-                    file_type = 'image'
+                file_type = FILE_TYPES.get(file_ext, 'unknown')
                 
                 files.append({
                     'id': row_dict['id'],
@@ -222,25 +222,19 @@ def main():
             db_path = os.path.join(os.path.dirname(folderPath), dbName)
             
             # Apply schema to new database
-            import subprocess
-            import sys
-            result = subprocess.run([
-                sys.executable, "apply_schema.py", "--db", db_path
-            ], capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                raise HTTPException(status_code=500, detail=f"Failed to create database schema: {result.stderr}")
+            try:
+                apply_schema(db_path)
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Failed to create database schema: {str(e)}")
             
             # Connect to new database
             new_db = SQLiteDatabase(db_path)
             new_db.connect()
             
-            # Process files and insert into database
+            # Process files in parallel, then insert into database
             processed_count = 0
-            for file_path in files:
+            for file_data in processor.process_files(files, processing_options):
                 try:
-                    file_data = processor.process_file(file_path, processing_options)
-                    
                     # Insert into database
                     cursor = new_db.cursor
                     cursor.execute("""
@@ -259,7 +253,7 @@ def main():
                     processed_count += 1
                     
                 except Exception as e:
-                    print(f"Error processing {file_path}: {str(e)}")
+                    print(f"Error processing {file_data['file_path']}: {str(e)}")
                     continue
             
             new_db.conn.commit()